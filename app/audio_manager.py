@@ -1,41 +1,69 @@
 import sounddevice as sd
+import soundfile as sf
 import numpy as np
 from pathlib import Path
 import tempfile
-import wave
-import threading
-import queue
 import time
 
 class AudioManager:
     def __init__(self):
         self.recording = False
         self.paused = False
-        self.audio_queue = queue.Queue()
-        self.recorded_frames = []
-        self.frames_lock = threading.Lock()
         self.sample_rate = 44100
         self.channels = 1
+        # One contiguous preallocated buffer (10 minutes, grown on demand)
+        # written directly by the audio callback - no per-block list append.
+        # int16 throughout: the WAV output is 16-bit PCM anyway, and half
+        # the bytes per sample halves capture memory bandwidth
+        self._pcm = np.empty(self.sample_rate * 600, dtype=np.int16)
+        self._n = 0
+        # Replacement buffer staged by ensure_capacity() on the GUI side;
+        # the callback adopts it with a small delta copy so the realtime
+        # thread never pays for a full-buffer memcpy
+        self._pcm_next = None
+        self._pcm_next_n = 0
+        # Created on save, one file per recording: a worker may still be
+        # hashing/uploading an earlier recording, so its WAV must never
+        # be rewritten underneath it. No file is created before the
+        # first save, so launching the app costs no temp-file inode for
+        # users who never record.
         self.temp_file = None
+        self._temp_files = []
         self.recording_thread = None
-        self._create_temp_file()
+        self._devices_cache = None
+        self._devices_ts = 0.0
 
     def _create_temp_file(self):
-        """Create a temporary WAV file for recording."""
+        """Create a new temporary WAV file for the current recording."""
         self.temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
+        self._temp_files.append(self.temp_file)
 
     def get_available_devices(self):
-        """Get list of available audio input devices."""
-        devices = sd.query_devices()
-        input_devices = []
-        for i, device in enumerate(devices):
-            if device['max_input_channels'] > 0:
-                input_devices.append({
-                    'index': i,
-                    'name': device['name'],
-                    'channels': device['max_input_channels']
-                })
-        return input_devices
+        """Get list of available audio input devices.
+
+        The PortAudio scan is cached for 10 seconds, long enough to cover
+        a dialog open plus the main-window refresh that follows it; use
+        refresh_devices() to force a rescan (e.g. after plugging in a mic).
+        """
+        if (self._devices_cache is None
+                or time.monotonic() - self._devices_ts >= 10):
+            devices = sd.query_devices()
+            input_devices = []
+            for i, device in enumerate(devices):
+                if device['max_input_channels'] > 0:
+                    input_devices.append({
+                        'index': i,
+                        'name': device['name'],
+                        'channels': device['max_input_channels']
+                    })
+            self._devices_cache = input_devices
+            self._devices_ts = time.monotonic()
+        return self._devices_cache
+
+    def refresh_devices(self):
+        """Invalidate the device cache and re-enumerate."""
+        self._devices_cache = None
+        return self.get_available_devices()
 
     def set_device(self, device_index):
         """Set the audio input device."""
@@ -47,23 +75,70 @@ class AudioManager:
             return False
 
     def _audio_callback(self, indata, frames, time, status):
-        """Callback function for audio recording."""
+        """Callback function for audio recording.
+
+        `indata` is a buffer PortAudio reuses across callbacks; it is
+        consumed into the ring inside this call and never retained, which
+        is what lets the capture path run without a single allocation.
+        """
         if status:
             print(status)
         if not self.paused:
-            self.audio_queue.put(indata.copy())
-            with self.frames_lock:
-                self.recorded_frames.append(indata.copy())
+            # Single-producer single-consumer: this callback is the only
+            # writer, so no lock is needed. Samples are written first and
+            # the counter published afterwards; readers snapshotting _n
+            # always see a fully-written prefix.
+            n, k = self._n, frames * self.channels
+            grown = self._pcm_next
+            if grown is not None:
+                # Adopt the buffer ensure_capacity() prepared off-thread:
+                # the prefix is already copied, so only the few blocks
+                # written since it was staged need moving here
+                grown[self._pcm_next_n:n] = self._pcm[self._pcm_next_n:n]
+                self._pcm = grown
+                self._pcm_next = None
+            if n + k > len(self._pcm):
+                # Last resort if capacity ran out before a staged buffer
+                # arrived (the GUI tick normally grows well ahead of this)
+                grown = np.empty(max(len(self._pcm) * 2, n + k),
+                                 dtype=np.int16)
+                grown[:n] = self._pcm[:n]
+                self._pcm = grown
+            np.copyto(self._pcm[n:n + k], indata.ravel())
+            self._n = n + k
+
+    def ensure_capacity(self):
+        """Stage a larger capture buffer before the callback needs it.
+
+        Called from the GUI's waveform tick while recording. Once the
+        buffer passes three-quarters full, a doubled buffer is allocated
+        and its prefix copied here - off the realtime thread - and left
+        for the callback to adopt, so the multi-millisecond memcpy of a
+        long recording never runs inside the PortAudio deadline.
+        """
+        if self._pcm_next is not None:
+            return
+        n = self._n
+        if n < len(self._pcm) - len(self._pcm) // 4:
+            return
+        grown = np.empty(len(self._pcm) * 2, dtype=np.int16)
+        grown[:n] = self._pcm[:n]
+        # Publish the prefix watermark first; the callback reads it only
+        # after seeing a non-None buffer
+        self._pcm_next_n = n
+        self._pcm_next = grown
 
     def start_recording(self):
         """Start audio recording."""
         if not self.recording:
             self.recording = True
             self.paused = False
-            self.recorded_frames = []
+            self._n = 0
+            self._pcm_next = None
             self.recording_thread = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
+                dtype='int16',
                 callback=self._audio_callback
             )
             self.recording_thread.start()
@@ -88,16 +163,20 @@ class AudioManager:
 
     def _save_recording(self):
         """Save recorded audio to WAV file."""
-        if not self.recorded_frames:
+        if not self._n:
             return None
 
         try:
-            with wave.open(self.temp_file.name, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)  # 16-bit audio
-                wf.setframerate(self.sample_rate)
-                for frame in self.recorded_frames:
-                    wf.writeframes((frame * 32767).astype(np.int16).tobytes())
+            # Fresh file per save: the previous recording may still be
+            # mid-upload in a transcription worker, and rewriting the
+            # WAV it has memory-mapped would corrupt that request (or
+            # SIGBUS it outright if the new recording is shorter). Old
+            # files are cleaned up on reset and at exit.
+            self._create_temp_file()
+            # libsndfile takes the int16 buffer as-is and performs the
+            # whole write in C - one call, no Python-level framing
+            sf.write(self.temp_file.name, self._pcm[:self._n],
+                     self.sample_rate, subtype='PCM_16')
             return self.temp_file.name
         except Exception as e:
             print(f"Error saving recording: {e}")
@@ -108,26 +187,47 @@ class AudioManager:
         return self.temp_file.name if self.temp_file else None
 
     def clear_recording(self):
-        """Clear the current recording."""
-        self.recorded_frames = []
-        if self.temp_file:
+        """Clear the current recording and delete its temp files."""
+        self._n = 0
+        for temp_file in self._temp_files:
             try:
-                Path(self.temp_file.name).unlink(missing_ok=True)
-                self._create_temp_file()
+                Path(temp_file.name).unlink(missing_ok=True)
             except Exception as e:
                 print(f"Error clearing recording: {e}")
+        self._temp_files.clear()
+        self.temp_file = None  # Recreated on the next save
+
+    def get_waveform_data(self, width=2048):
+        """Get waveform data for visualization.
+
+        Returns a strided view decimated to roughly `width` samples - the
+        plot can't show more points than it has pixels, so there is no
+        reason to hand it the full recording.
+        """
+        # Snapshot the published counter, then the buffer reference; the
+        # slice clamps to the buffer so a concurrent grow is harmless
+        end = self._n
+        if not end:
+            return np.empty(0, dtype=self._pcm.dtype)
+        stride = max(1, end // width)
+        return self._pcm[:end:stride]
+
+    def get_new_samples(self, start):
+        """Return samples recorded since `start` and the new cursor position.
 
-    def get_waveform_data(self):
-        """Get waveform data for visualization."""
-        with self.frames_lock:
-            if not self.recorded_frames:
-                return np.array([])
-            return np.concatenate(self.recorded_frames.copy())
+        The returned array is a zero-copy view into the recording buffer.
+        Lock-free: the audio callback is the only writer and publishes the
+        sample counter after the samples themselves are in place.
+        """
+        end = self._n
+        if start > end:
+            start = 0  # Recording was reset since the caller last read
+        return self._pcm[start:end], end
 
     def __del__(self):
         """Cleanup temporary files."""
-        if self.temp_file:
+        for temp_file in self._temp_files:
             try:
-                Path(self.temp_file.name).unlink(missing_ok=True)
+                Path(temp_file.name).unlink(missing_ok=True)
             except Exception:
                 pass
\ No newline at end of file
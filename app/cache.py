@@ -0,0 +1,68 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+class ResponseCache:
+    """On-disk cache for OpenAI responses.
+
+    Format responses are keyed by (model, temperature, normalized text)
+    and transcriptions by the audio file's SHA-256, so re-running an
+    identical request returns instantly with zero API spend. The store
+    is capped at max_entries rows; the oldest entries are evicted on
+    insert so the database can't grow without bound.
+    """
+
+    def __init__(self, cache_file=None, max_entries=500):
+        if cache_file is None:
+            cache_dir = Path(os.path.expanduser("~/.config/thought-pad"))
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = cache_dir / "cache.db"
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(cache_file), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT, ts REAL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def format_key(model, temperature, text):
+        """Cache key for a chat-completion format request."""
+        digest = hashlib.sha256(text.strip().lower().encode('utf-8')).hexdigest()
+        return f"format:{model}:{temperature}:{digest}"
+
+    @staticmethod
+    def transcription_key(audio_path):
+        """Cache key for a transcription request (hash of the audio bytes)."""
+        file_hash = hashlib.sha256()
+        with open(audio_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1048576), b''):
+                file_hash.update(chunk)
+        return f"transcribe:{file_hash.hexdigest()}"
+
+    def get(self, key):
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key, response):
+        """Store a response under key, evicting the oldest past the cap."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY ts DESC"
+                " LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
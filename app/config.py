@@ -1,5 +1,6 @@
 import os
 import json
+import threading
 from pathlib import Path
 
 class Config:
@@ -18,6 +19,9 @@ class Config:
             "default_download_format": "Markdown"  # Default download format
         }
         self.current_config = {}
+        self._dirty = False
+        self._flush_timer = None
+        self._flush_lock = threading.Lock()
         self._ensure_config_exists()
         self.load_config()
 
@@ -37,28 +41,83 @@ class Config:
             print(f"Error loading config: {e}")
             self.current_config = self.default_config.copy()
             self.save_config()
+        self._refresh_hot_keys()
 
-    def save_config(self):
-        """Save current configuration to file."""
+    def _refresh_hot_keys(self):
+        """Re-bind plain attributes for values read on every transcription."""
+        self._api_key_cached = self.current_config.get('openai_api_key', '')
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.current_config, f, indent=4)
+            self.gpt_temperature = float(self.current_config.get('gpt_temperature', 0.3))
+        except (TypeError, ValueError):
+            # A hand-edited or corrupted value shouldn't stop the app
+            # from launching; fall back to the default
+            self.gpt_temperature = 0.3
+
+    def save_config(self, config=None):
+        """Save configuration to file atomically; returns True on success."""
+        if config is None:
+            config = self.current_config
+        tmp_file = self.config_file.with_suffix('.json.tmp')
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(config, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            # Rename over the real file so a crash mid-write can't corrupt it
+            os.replace(tmp_file, self.config_file)
+            return True
         except Exception as e:
             print(f"Error saving config: {e}")
+            return False
+
+    def _schedule_flush(self):
+        """Start the write-back timer if one isn't already pending."""
+        with self._flush_lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(2.0, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Write any pending changes to disk immediately."""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        # Snapshot before writing: dict() copies under the GIL in one C
+        # call, so the GUI thread can't resize current_config while
+        # json.dump walks it on the timer thread
+        if not self.save_config(dict(self.current_config)):
+            # The changes are still pending - mark them dirty again and
+            # re-arm the timer so a transient failure isn't a silent loss
+            self._dirty = True
+            self._schedule_flush()
 
     def get(self, key, default=None):
         """Get a configuration value."""
         return self.current_config.get(key, default)
 
     def set(self, key, value):
-        """Set a configuration value and save."""
+        """Set a configuration value; the write to disk is batched."""
         self.current_config[key] = value
-        self.save_config()
+        self._refresh_hot_keys()
+        self._dirty = True
+        self._schedule_flush()
+
+    def update(self, mapping):
+        """Set several configuration values with a single batched write."""
+        self.current_config.update(mapping)
+        self._refresh_hot_keys()
+        self._dirty = True
+        self._schedule_flush()
 
     @property
     def api_key(self):
         """Get the OpenAI API key."""
-        return self.get('openai_api_key', '')
+        return self._api_key_cached
 
     @api_key.setter
     def api_key(self, value):
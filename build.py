@@ -1,20 +1,22 @@
 #!/usr/bin/env python3
 import os
-import sys
-import site
 import shutil
-import glob
+import atexit
+import argparse
+import functools
+import tempfile
+import subprocess
 from pathlib import Path
 import PyQt5
 
+@functools.lru_cache(maxsize=1)
 def get_qt_paths():
-    """Get the Qt directory paths."""
+    """Get the Qt directory paths (resolved once per process)."""
     system_lib_path = '/usr/lib64'
-    venv_path = os.path.dirname(os.path.dirname(sys.executable))
-    lib_path = os.path.join(venv_path, 'lib64', 'python3.11', 'site-packages', 'PyQt5')
-    if not os.path.exists(lib_path):
-        lib_path = os.path.join(venv_path, 'lib', 'python3.11', 'site-packages', 'PyQt5')
-    
+    # PyQt5 is already imported, so its location is known - no need to
+    # probe candidate site-packages layouts with os.path.exists
+    lib_path = os.path.dirname(PyQt5.__file__)
+
     paths = {
         'root': lib_path,
         'plugins': os.path.join(lib_path, "Qt5", "plugins"),
@@ -23,19 +25,46 @@ def get_qt_paths():
         'qml': os.path.join(lib_path, "Qt5", "qml"),
         'system_libs': system_lib_path
     }
-    
-    # Print paths for debugging
+
+    # Print paths for debugging (one stat per path, in a single pass)
     print("PyQt5 paths:")
     for key, value in paths.items():
-        print(f"{key}: {value}")
-        print(f"Exists: {os.path.exists(value)}")
-    
+        print(f"{key}: {value} (exists: {os.path.exists(value)})")
+
     return paths
 
+def parse_args():
+    parser = argparse.ArgumentParser(description='Build the ThoughtPad executable.')
+    parser.add_argument('--mode', choices=['onedir', 'onefile'], default=None,
+                        help='bundle layout (default: onedir; --release defaults to onefile)')
+    parser.add_argument('--release', action='store_true',
+                        help='release build (implies --mode onefile unless overridden)')
+    parser.add_argument('--upx', action='store_true',
+                        help='compress bundled binaries with UPX')
+    parser.add_argument('--fresh', action='store_true',
+                        help='wipe build/ and dist/ and force a clean re-analysis')
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+
+    # Give this run a private PyInstaller config/bincache directory so
+    # concurrent builds (e.g. a CI matrix) can't corrupt each other's cache
+    config_dir = tempfile.mkdtemp(prefix='pyi_cfg_')
+    os.environ['PYINSTALLER_CONFIG_DIR'] = config_dir
+    atexit.register(shutil.rmtree, config_dir, ignore_errors=True)
+
     # Get the Qt paths
     qt_paths = get_qt_paths()
-    
+
+    # Onefile bundles are reserved for release builds; dev builds default
+    # to the faster onedir layout unless --mode overrides it
+    onefile = args.mode == 'onefile' or (args.mode is None and args.release)
+
+    # UPX is opt-in: the per-binary compression pass adds seconds to every
+    # build and has a history of breaking Qt platform plugins
+    upx = args.upx
+
     # Get the current directory
     current_dir = os.path.abspath(os.path.dirname(__file__))
     
@@ -57,11 +86,10 @@ datas += collect_data_files('PyQt5')
 datas += copy_metadata('openai')
 datas += copy_metadata('sounddevice')
 datas += copy_metadata('numpy')
-datas += copy_metadata('matplotlib')
 
 # Add hidden imports
 hiddenimports += ['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets']
-hiddenimports += ['numpy', 'openai', 'sounddevice', 'matplotlib']
+hiddenimports += ['numpy', 'openai', 'sounddevice']
 hiddenimports += ['app.gui']  # Add the app package
 
 # Add app package data
@@ -76,14 +104,20 @@ a = Analysis(
     hookspath=[],
     hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    # The app never imports these; excluding them keeps Analysis fast and
+    # the bundle tens of MB smaller
+    excludes=['matplotlib', 'tkinter', 'PIL.ImageTk'],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     noarchive=False,
 )
 
 pyz = PYZ(a.pure, a.zipped_data)
+'''
 
+    if onefile:
+        # Self-contained single-file executable
+        spec_content += f'''
 exe = EXE(
     pyz,
     a.scripts,
@@ -95,7 +129,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx={upx},
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,
@@ -105,14 +139,59 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+'''
+    else:
+        # Dev: onedir skips the LZMA compression pass at build time and
+        # the self-extraction step at every launch
+        spec_content += f'''
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='thoughtpad',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx={upx},
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx={upx},
+    upx_exclude=[],
+    name='thoughtpad',
+)
 '''
 
     # Write the spec file
     with open('thoughtpad.spec', 'w') as f:
         f.write(spec_content)
 
-    # Run PyInstaller
-    os.system('pyinstaller thoughtpad.spec --clean')
+    # Run PyInstaller. --clean is only passed for --fresh builds: without
+    # it the work directory caches Analysis results, so iterative rebuilds
+    # after an app/ edit are a link step instead of a full re-analysis.
+    cmd = ['pyinstaller', 'thoughtpad.spec', '--noconfirm']
+    if args.fresh:
+        for stale in ('build', 'dist'):
+            shutil.rmtree(stale, ignore_errors=True)
+        cmd.append('--clean')
+
+    # Capture the build output to a per-run log so a failed stage can be
+    # inspected after the fact instead of scrolling the terminal
+    os.makedirs('build', exist_ok=True)
+    with open(os.path.join('build', 'pyinstaller.log'), 'w') as log:
+        subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT, check=True)
 
 if __name__ == '__main__':
     main()